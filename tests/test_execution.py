@@ -18,18 +18,19 @@ import tempfile
 from unittest import TestCase
 
 from mock.mock import Mock
-from nose.tools import assert_equal
+from nose.tools import assert_equal, assert_in, assert_is
 from datetime import datetime
 
 from wa.framework.configuration import RunConfiguration
 from wa.framework.configuration.core import JobSpec, Status
+from wa.framework.configuration.execution import permute_iterations
 from wa.framework.execution import ExecutionContext, Runner
 from wa.framework.job import Job
 from wa.framework.output import RunOutput, init_run_output
 from wa.framework.output_processor import ProcessorManager
 import wa.framework.signal as signal
 from wa.framework.run import JobState
-from wa.framework.exception import ExecutionError
+from wa.framework.exception import ExecutionError, WorkloadError
 
 
 class MockConfigManager(Mock):
@@ -297,6 +298,72 @@ class TestJobState(TestCase):
             assert False, "ExecutionError not raised"
 
 
+class TestErrorUiState(TestCase):
+
+    def setUp(self):
+        self.context = get_context()
+        self.context.record_ui_state = Mock(side_effect=RuntimeError('target wedged'))
+        self.job = Job(get_jobspec(), 1, self.context)
+        self.job.workload = Mock(phones_home=False)
+        self.context.run_state.add_job(self.job)
+        self.runner = Runner(self.context, MockProcessorManager())
+
+    def test_setup_error_preserved(self):
+        error = WorkloadError('setup failed')
+        self.job.workload.setup.side_effect = error
+        self._check_error_preserved(error, 'setup-error')
+
+    def test_run_error_preserved(self):
+        error = WorkloadError('run failed')
+        self.job.workload.run.side_effect = error
+        self._check_error_preserved(error, 'run-error')
+
+    def _check_error_preserved(self, error, basename):
+        # The exception raised by do_run_job() is what run_next_job() handles,
+        # so it must be the original error rather than the UI state failure.
+        with self.assertLogs('runner', level='WARNING') as logs:
+            with self.assertRaises(WorkloadError) as cm:
+                self.runner.do_run_job(self.job, self.context)
+        assert_is(cm.exception, error)
+        self.context.record_ui_state.assert_called_once_with(basename)
+        assert_in('WARNING:runner:Could not record UI state: target wedged',
+                  logs.output)
+        assert_equal(self.job.status, Status.FAILED)
+
+
+class TestPermuteIterations(TestCase):
+
+    def setUp(self):
+        # Two sections (X and Y) with two global specs (A and B), in the order
+        # JobGenerator produces them.
+        self.specs = [get_jobspec(spec_id, 2)
+                      for spec_id in ['X-A', 'X-B', 'Y-A', 'Y-B']]
+
+    def test_by_workload(self):
+        assert_equal(self._permute('by_workload'),
+                     ['X-A1', 'X-A2', 'X-B1', 'X-B2',
+                      'Y-A1', 'Y-A2', 'Y-B1', 'Y-B2'])
+
+    def test_by_iteration(self):
+        assert_equal(self._permute('by_iteration'),
+                     ['X-A1', 'X-B1', 'Y-A1', 'Y-B1',
+                      'X-A2', 'X-B2', 'Y-A2', 'Y-B2'])
+
+    def test_uneven_iterations(self):
+        self.specs[1].iterations = 3
+        assert_equal(self._permute('by_iteration'),
+                     ['X-A1', 'X-B1', 'Y-A1', 'Y-B1',
+                      'X-A2', 'X-B2', 'Y-A2', 'Y-B2', 'X-B3'])
+
+    def test_random(self):
+        result = self._permute('random')
+        assert_equal(sorted(result), sorted(self._permute('by_workload')))
+
+    def _permute(self, exec_order):
+        return ['{}{}'.format(spec.id, i)
+                for spec, i in permute_iterations(self.specs, exec_order)]
+
+
 def get_context(path=None):
     if not path:
         path = tempfile.mkstemp()[1]
@@ -308,8 +375,11 @@ def get_context(path=None):
     return ExecutionContext(config, Mock(), output)
 
 
-def get_jobspec():
+def get_jobspec(spec_id=None, iterations=1):
     job_spec = JobSpec()
     job_spec.augmentations = {}
     job_spec.finalize()
+    if spec_id is not None:
+        job_spec.id = spec_id
+    job_spec.iterations = iterations
     return job_spec
@@ -15,11 +15,16 @@
 
 
 # pylint: disable=R0201
+import subprocess
 from unittest import TestCase
 
 from nose.tools import raises, assert_equal, assert_not_equal, assert_in, assert_not_in
 from nose.tools import assert_true, assert_false, assert_raises, assert_is, assert_list_equal
 
+from mock.mock import Mock, call
+
+from wa.utils.log import log_error
+from wa.utils.misc import roundrobin
 from wa.utils.types import (list_or_integer, list_or_bool, caseless_string,
                             arguments, prioritylist, enum, level, toggle_set)
 
@@ -197,3 +202,44 @@ class  TestToggleSet(TestCase):
 
         ts1 = toggle_set(['~one', 'two', 'three', 'one'])
         assert_equal(ts1, toggle_set(['one', 'two', 'three']))
+
+
+class TestRoundRobin(TestCase):
+
+    def test_uneven_lengths(self):
+        assert_list_equal(list(roundrobin('ABC', 'D', 'EF')),
+                          ['A', 'D', 'E', 'B', 'F', 'C'])
+
+    def test_empty(self):
+        assert_list_equal(list(roundrobin()), [])
+        assert_list_equal(list(roundrobin([], 'AB', [])), ['A', 'B'])
+
+
+class TestLogError(TestCase):
+
+    def test_output_bytes(self):
+        logger = Mock()
+        try:
+            raise subprocess.TimeoutExpired('sleep 10', 5, output=b'partial\xffoutput')
+        except subprocess.TimeoutExpired as e:
+            log_error(e, logger)
+        assert_equal(logger.error.call_args_list[-1],
+                     call('OUTPUT:\npartial\ufffdoutput\n'))
+
+    def test_output_str(self):
+        logger = Mock()
+        try:
+            raise subprocess.TimeoutExpired('sleep 10', 5, output='partial output')
+        except subprocess.TimeoutExpired as e:
+            log_error(e, logger)
+        assert_equal(logger.error.call_args_list[-1],
+                     call('OUTPUT:\npartial output\n'))
+
+    def test_no_output(self):
+        logger = Mock()
+        try:
+            raise subprocess.TimeoutExpired('sleep 10', 5)
+        except subprocess.TimeoutExpired as e:
+            log_error(e, logger)
+        for args, _ in logger.error.call_args_list:
+            assert_not_in('OUTPUT:', args[0])
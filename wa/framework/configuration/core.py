@@ -445,14 +445,14 @@ class MetaConfiguration(Configuration):
 
     name = "Meta Configuration"
 
-    core_plugin_packages = [
+    core_plugin_packages = (
         'wa.commands',
         'wa.framework.getters',
         'wa.framework.target.descriptor',
         'wa.instruments',
         'wa.output_processors',
         'wa.workloads',
-    ]
+    )
 
     config_points = [
         ConfigurationPoint(
@@ -558,7 +558,7 @@ class MetaConfiguration(Configuration):
         if extra_plugin_paths:
             self.set('extra_plugin_paths', extra_plugin_paths.split(os.pathsep))
 
-        self.plugin_packages = copy(self.core_plugin_packages)
+        self.plugin_packages = list(self.core_plugin_packages)
         if os.path.isfile(self.additional_packages_file):
             with open(self.additional_packages_file) as fh:
                 extra_packages = [p.strip() for p in fh.read().split('\n') if p.strip()]
@@ -617,17 +617,14 @@ class RunConfiguration(Configuration):
                 to the second iteration.  E.g. A1 B1 C1 A2 C2 A3. This is the
                 default if no order is explicitly specified.
 
-                In case of multiple sections, this will spread them out, such
-                that specs from the same section are further part. E.g. given
-                sections X and Y, global specs A and B, and two iterations,
-                this will run ::
-
-                        X.A1, Y.A1, X.B1, Y.B1, X.A2, Y.A2, X.B2, Y.B2
+                In case of multiple sections, specs are run in the order they
+                appear in each section, so this currently produces the same
+                order as ``"by_section"``.
 
             ``"by_section"``
-                Same  as ``"by_iteration"``, however this will group specs from
-                the same section together, so given sections X and Y, global
-                specs A and B, and two iterations, this will run ::
+                Same  as ``"by_iteration"``, grouping specs from the same
+                section together, so given sections X and Y, global specs A
+                and B, and two iterations, this will run ::
 
                         X.A1, X.B1, Y.A1, Y.B1, X.A2, X.B2, Y.A2, Y.B2
 
@@ -14,9 +14,7 @@
 #
 
 import random
-from itertools import groupby, chain
-
-from future.moves.itertools import zip_longest
+from itertools import groupby, chain, repeat
 
 from devlib.utils.types import identifier
 
@@ -27,6 +25,7 @@ from wa.framework.configuration.plugin_cache import PluginCache
 from wa.framework.exception import NotFoundError, ConfigError
 from wa.framework.job import Job
 from wa.utils import log
+from wa.utils.misc import roundrobin
 from wa.utils.serializer import Podable
 
 
@@ -162,6 +161,15 @@ class ConfigManager(object):
         self._jobs_generated = True
 
 
+def _spec_iterations(spec):
+    """
+    Returns an iterator over ``(spec, iteration)`` tuples for all iterations
+    of the specified spec.
+
+    """
+    return zip(repeat(spec), range(1, spec.iterations + 1))
+
+
 def permute_by_workload(specs):
     """
     This is that "classic" implementation that executes all iterations of a
@@ -169,8 +177,8 @@ def permute_by_workload(specs):
 
     """
     for spec in specs:
-        for i in range(1, spec.iterations + 1):
-            yield (spec, i)
+        for t in _spec_iterations(spec):
+            yield t
 
 
 def permute_by_iteration(specs):
@@ -179,25 +187,20 @@ def permute_by_iteration(specs):
     next iteration, i.e. A1, B1, C1, A2, B2, C2...  instead of  A1, A1, B1, B2,
     C1, C2...
 
-    If multiple sections where specified in the agenda, this will run all
-    sections for the first global spec first, followed by all sections for the
-    second spec, etc.
-
-    e.g. given sections X and Y, and global specs A and B, with 2 iterations,
-    this will run
+    Specs are kept in the order they are given; only adjacent specs with the
+    same workload id are grouped together. Since JobGenerator emits specs
+    section by section, with multiple sections this produces the same order as
+    ``by_section``, e.g. given sections X and Y, and global specs A and B, with
+    2 iterations, this will run
 
-    X.A1, Y.A1, X.B1, Y.B1, X.A2, Y.A2, X.B2, Y.B2
+    X.A1, X.B1, Y.A1, Y.B1, X.A2, X.B2, Y.A2, Y.B2
 
     """
     groups = [list(g) for _, g in groupby(specs, lambda s: s.workload_id)]
 
-    all_tuples = []
-    for spec in chain(*groups):
-        all_tuples.append([(spec, i + 1)
-                           for i in range(spec.iterations)])
-    for t in chain(*list(map(list, zip_longest(*all_tuples)))):
-        if t is not None:
-            yield t
+    all_tuples = [_spec_iterations(spec) for spec in chain(*groups)]
+    for t in roundrobin(*all_tuples):
+        yield t
 
 
 def permute_by_section(specs):
@@ -217,13 +220,9 @@ def permute_by_section(specs):
     """
     groups = [list(g) for _, g in groupby(specs, lambda s: s.section_id)]
 
-    all_tuples = []
-    for spec in chain(*groups):
-        all_tuples.append([(spec, i + 1)
-                           for i in range(spec.iterations)])
-    for t in chain(*list(map(list, zip_longest(*all_tuples)))):
-        if t is not None:
-            yield t
+    all_tuples = [_spec_iterations(spec) for spec in chain(*groups)]
+    for t in roundrobin(*all_tuples):
+        yield t
 
 
 def permute_randomly(specs):
@@ -231,10 +230,7 @@ def permute_randomly(specs):
     This will generate a random permutation of specs/iteration tuples.
 
     """
-    result = []
-    for spec in specs:
-        for i in range(1, spec.iterations + 1):
-            result.append((spec, i))
+    result = list(chain.from_iterable(_spec_iterations(spec) for spec in specs))
     random.shuffle(result)
     for t in result:
         yield t
@@ -249,7 +245,8 @@ permute_map = {
 
 
 def permute_iterations(specs, exec_order):
-    if exec_order not in permute_map:
+    permute = permute_map.get(exec_order)
+    if permute is None:
         msg = 'Unknown execution order "{}"; must be in: {}'
         raise ValueError(msg.format(exec_order, list(permute_map.keys())))
-    return permute_map[exec_order](specs)
+    return permute(specs)
@@ -19,7 +19,7 @@ import hashlib
 import logging
 import os
 import shutil
-from copy import copy
+from collections import deque
 from datetime import datetime
 
 import wa.framework.signal as signal
@@ -66,16 +66,6 @@ class ExecutionContext(object):
             return True
         return self.current_job.spec.id != self.next_job.spec.id
 
-    @property
-    def workload(self):
-        if self.current_job:
-            return self.current_job.workload
-
-    @property
-    def job_output(self):
-        if self.current_job:
-            return self.current_job.output
-
     @property
     def output(self):
         if self.current_job:
@@ -103,6 +93,8 @@ class ExecutionContext(object):
         self.job_queue = None
         self.completed_jobs = None
         self.current_job = None
+        self.workload = None
+        self.job_output = None
         self.successful_jobs = 0
         self.failed_jobs = 0
         self.run_interrupted = False
@@ -111,7 +103,7 @@ class ExecutionContext(object):
     def start_run(self):
         self.output.info.start_time = datetime.utcnow()
         self.output.write_info()
-        self.job_queue = copy(self.cm.jobs)
+        self.job_queue = deque(self.cm.jobs)
         self.completed_jobs = []
         self.run_state.status = Status.STARTED
         self.output.status = Status.STARTED
@@ -138,10 +130,15 @@ class ExecutionContext(object):
     def start_job(self):
         if not self.job_queue:
             raise RuntimeError('No jobs to run')
-        self.current_job = self.job_queue.pop(0)
-        job_output = init_job_output(self.run_output, self.current_job)
-        self.current_job.set_output(job_output)
-        return self.current_job
+        job = self.current_job = self.job_queue.popleft()
+        job_output = init_job_output(self.run_output, job)
+        job.set_output(job_output)
+        # workload and job_output are read frequently by instruments and
+        # output processors, so they are set here rather than looked up
+        # through current_job on every access.
+        self.workload = job.workload
+        self.job_output = job_output
+        return job
 
     def end_job(self):
         if not self.current_job:
@@ -149,6 +146,8 @@ class ExecutionContext(object):
         self.completed_jobs.append(self.current_job)
         self.output.write_result()
         self.current_job = None
+        self.workload = None
+        self.job_output = None
 
     def set_status(self, status, force=False, write=True):
         if not self.current_job:
@@ -172,7 +171,7 @@ class ExecutionContext(object):
 
     def skip_remaining_jobs(self):
         while self.job_queue:
-            job = self.job_queue.pop(0)
+            job = self.job_queue.popleft()
             self.skip_job(job)
         self.write_state()
 
@@ -216,9 +215,9 @@ class ExecutionContext(object):
 
     def add_metric(self, name, value, units=None, lower_is_better=False,
                    classifiers=None):
-        if self.current_job:
-            classifiers = merge_config_values(self.current_job.classifiers,
-                                              classifiers)
+        job = self.current_job
+        if job is not None:
+            classifiers = merge_config_values(job.classifiers, classifiers)
         self.output.add_metric(name, value, units, lower_is_better, classifiers)
 
     def get_artifact(self, name):
@@ -278,7 +277,7 @@ class ExecutionContext(object):
             self.take_uiautomator_dump('{}.uix'.format(basename))
 
     def initialize_jobs(self):
-        new_queue = []
+        new_queue = deque()
         failed_ids = []
         for job in self.job_queue:
             if job.id in failed_ids:
@@ -446,9 +445,8 @@ class Executor(object):
 
         counter = context.run_state.get_status_counts()
         parts = []
-        for status in reversed(Status.levels):
-            if status in counter:
-                parts.append('{} {}'.format(counter[status], status))
+        for status in sorted(counter, reverse=True):
+            parts.append('{} {}'.format(counter[status], status))
         self.logger.info('{}{}'.format(status_summary, ', '.join(parts)))
 
         self.logger.info('Results can be found in {}'.format(output.basepath))
@@ -489,6 +487,8 @@ class Runner(object):
         self.pm = pm
         self.output = self.context.output
         self.config = self.context.cm
+        self.run_config = self.config.run_config
+        self.retry_on_status = frozenset(self.run_config.retry_on_status)
 
     def run(self):
         try:
@@ -508,7 +508,7 @@ class Runner(object):
         except Exception as e:
             message = e.args[0] if e.args else str(e)
             log.log_error(e, self.logger)
-            self.logger.error('Skipping remaining jobs due to "{}".'.format(message))
+            self.logger.error('Skipping remaining jobs due to "%s".', message)
             self.context.skip_remaining_jobs()
             raise e
         finally:
@@ -537,7 +537,7 @@ class Runner(object):
             self.pm.process_run_output(self.context)
             self.pm.export_run_output(self.context)
         self.pm.finalize(self.context)
-        if self.context.reboot_policy.reboot_on_run_completion:
+        if self.run_config.reboot_policy.reboot_on_run_completion:
             self.logger.info('Rebooting target on run completion.')
             self.context.tm.reboot(self.context)
         signal.disconnect(self._error_signalled_callback, signal.ERROR_LOGGED)
@@ -549,10 +549,11 @@ class Runner(object):
 
         try:
             log.indent()
-            if self.context.reboot_policy.reboot_on_each_job:
+            reboot_policy = self.run_config.reboot_policy
+            if reboot_policy.reboot_on_each_job:
                 self.logger.info('Rebooting on new job.')
                 self.context.tm.reboot(context)
-            elif self.context.reboot_policy.reboot_on_each_spec and context.spec_changed:
+            elif reboot_policy.reboot_on_each_spec and context.spec_changed:
                 self.logger.info('Rebooting on new spec.')
                 self.context.tm.reboot(context)
 
@@ -583,7 +584,7 @@ class Runner(object):
 
     def do_run_job(self, job, context):
         # pylint: disable=too-many-branches,too-many-statements
-        rc = self.context.cm.run_config
+        rc = self.run_config
         if job.workload.phones_home and not rc.allow_phone_home:
             self.logger.warning('Skipping job {} ({}) due to allow_phone_home=False'
                                 .format(job.id, job.workload.name))
@@ -605,7 +606,7 @@ class Runner(object):
             log.log_error(e, self.logger)
             if isinstance(e, (TargetError, TimeoutError)):
                 context.tm.verify_target_responsive(context)
-            self.context.record_ui_state('setup-error')
+            self._record_error_ui_state('setup-error')
             raise e
 
         try:
@@ -621,7 +622,7 @@ class Runner(object):
                 log.log_error(e, self.logger)
                 if isinstance(e, (TargetError, TimeoutError)):
                     context.tm.verify_target_responsive(context)
-                self.context.record_ui_state('run-error')
+                self._record_error_ui_state('run-error')
                 raise e
             finally:
                 try:
@@ -633,12 +634,12 @@ class Runner(object):
                     context.set_job_status(job, Status.PARTIAL)
                     if isinstance(e, (TargetError, TimeoutError)):
                         context.tm.verify_target_responsive(context)
-                    self.context.record_ui_state('output-error')
+                    self._record_error_ui_state('output-error')
                     raise
 
         except KeyboardInterrupt:
             context.run_interrupted = True
-            context.set_status(Status.ABORTED)
+            context.set_job_status(job, Status.ABORTED)
             raise
         finally:
             # If setup was successfully completed, teardown must
@@ -646,18 +647,18 @@ class Runner(object):
             job.teardown(context)
 
     def check_job(self, job):
-        rc = self.context.cm.run_config
-        if job.status in rc.retry_on_status:
+        rc = self.run_config
+        if job.status in self.retry_on_status:
             if job.retries < rc.max_retries:
-                msg = 'Job {} iteration {} completed with status {}. retrying...'
-                self.logger.error(msg.format(job.id, job.iteration, job.status))
+                msg = 'Job %s iteration %s completed with status %s. retrying...'
+                self.logger.error(msg, job.id, job.iteration, job.status)
                 self.retry_job(job)
                 self.context.move_failed(job)
                 self.context.write_state()
             else:
-                msg = 'Job {} iteration {} completed with status {}. '\
+                msg = 'Job %s iteration %s completed with status %s. '\
                       'Max retries exceeded.'
-                self.logger.error(msg.format(job.id, job.iteration, job.status))
+                self.logger.error(msg, job.id, job.iteration, job.status)
                 self.context.failed_jobs += 1
                 self.send(signal.JOB_FAILED)
                 if rc.bail_on_job_failure:
@@ -677,12 +678,21 @@ class Runner(object):
         retry_job.state = job.state
         retry_job.retries = job.retries + 1
         self.context.set_job_status(retry_job, Status.PENDING, force=True)
-        self.context.job_queue.insert(0, retry_job)
+        self.context.job_queue.appendleft(retry_job)
         self.send(signal.JOB_RESTARTED)
 
     def send(self, s):
         signal.send(s, self, self.context)
 
+    def _record_error_ui_state(self, basename):
+        # This is called while handling a job error; a failure to capture the
+        # UI state (e.g. because the target is wedged) must not replace the
+        # original exception.
+        try:
+            self.context.record_ui_state(basename)
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.warning('Could not record UI state: %s', e)
+
     def _error_signalled_callback(self, record):
         self.context.add_event(record.getMessage())
 
@@ -28,6 +28,9 @@ from wa.framework.run import JobState
 
 class Job(object):
 
+    __slots__ = ['logger', 'spec', 'iteration', 'context', 'workload', 'output',
+                 'run_time', 'classifiers', 'state', '_has_been_initialized']
+
     _workload_cache = {}
 
     @property
@@ -23,6 +23,7 @@ except ImportError:
 import logging
 import os
 import shutil
+import stat
 import tarfile
 import tempfile
 from collections import OrderedDict, defaultdict
@@ -142,12 +143,14 @@ class Output(object):
         self.result.add_metric(name, value, units, lower_is_better, classifiers)
 
     def add_artifact(self, name, path, kind, description=None, classifiers=None):
-        if not os.path.exists(path):
+        path_stat = _stat_path(path)
+        if path_stat is None:
             path = self.get_path(path)
-        if not os.path.exists(path):
+            path_stat = _stat_path(path)
+        if path_stat is None:
             msg = 'Attempting to add non-existing artifact: {}'
             raise HostError(msg.format(path))
-        is_dir = os.path.isdir(path)
+        is_dir = stat.S_ISDIR(path_stat.st_mode)
         path = os.path.relpath(path, self.basepath)
 
         self.result.add_artifact(name, path, kind, description, classifiers, is_dir)
@@ -369,7 +372,8 @@ class Result(Podable):
         instance = super(Result, Result).from_pod(pod)
         instance.status = Status.from_pod(pod['status'])
         instance.metrics = [Metric.from_pod(m) for m in pod['metrics']]
-        instance.artifacts = [Artifact.from_pod(a) for a in pod['artifacts']]
+        for artifact_pod in pod['artifacts']:
+            instance._index_artifact(Artifact.from_pod(artifact_pod))  # pylint: disable=protected-access
         instance.events = [Event.from_pod(e) for e in pod['events']]
         instance.classifiers = pod.get('classifiers', OrderedDict())
         instance.metadata = pod.get('metadata', OrderedDict())
@@ -384,6 +388,7 @@ class Result(Podable):
         self.events = []
         self.classifiers = OrderedDict()
         self.metadata = OrderedDict()
+        self._artifacts_by_name = {}
 
     def add_metric(self, name, value, units=None, lower_is_better=False,
                    classifiers=None):
@@ -396,7 +401,7 @@ class Result(Podable):
         artifact = Artifact(name, path, kind, description=description,
                             classifiers=classifiers, is_dir=is_dir)
         logger.debug('Adding artifact: {}'.format(artifact))
-        self.artifacts.append(artifact)
+        self._index_artifact(artifact)
 
     def add_event(self, message):
         self.events.append(Event(message))
@@ -408,10 +413,10 @@ class Result(Podable):
         return None
 
     def get_artifact(self, name):
-        for artifact in self.artifacts:
-            if artifact.name == name:
-                return artifact
-        raise HostError('Artifact "{}" not found'.format(name))
+        artifact = self._artifacts_by_name.get(name)
+        if artifact is None:
+            raise HostError('Artifact "{}" not found'.format(name))
+        return artifact
 
     def add_classifier(self, name, value, overwrite=False):
         if name in self.classifiers and not overwrite:
@@ -476,6 +481,12 @@ class Result(Podable):
                 raise ValueError('Invalid value for key "{}": {}'.format(key, args))
             self.metadata[key] = args[0]
 
+    def _index_artifact(self, artifact):
+        self.artifacts.append(artifact)
+        # Keep the first artifact added under a given name, matching the
+        # order a scan of self.artifacts would find them in.
+        self._artifacts_by_name.setdefault(artifact.name, artifact)
+
     def to_pod(self):
         pod = super(Result, self).to_pod()
         pod['status'] = self.status.to_pod()
@@ -766,7 +777,12 @@ def init_run_output(path, wa_state, force=False):
 def init_job_output(run_output, job):
     output_name = '{}-{}-{}'.format(job.id, job.spec.label, job.iteration)
     path = os.path.join(run_output.basepath, output_name)
-    ensure_directory_exists(path)
+    # The run output directory always exists at this point, so a single
+    # mkdir() is enough (rather than an isdir() check followed by makedirs()).
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        pass
     write_pod(Result().to_pod(), os.path.join(path, 'result.json'))
     job_output = JobOutput(path, job.id, job.label, job.iteration, job.retries)
     job_output.spec = job.spec
@@ -785,6 +801,18 @@ def discover_wa_outputs(path):
             dirs.clear()
 
 
+def _stat_path(path):
+    """
+    Returns the ``os.stat()`` result for ``path``, or ``None`` if it does not
+    exist. This allows checking for existence and type with a single call.
+
+    """
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
 def _save_raw_config(meta_dir, state):
     raw_config_dir = os.path.join(meta_dir, 'raw_config')
     os.makedirs(raw_config_dir)
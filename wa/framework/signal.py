@@ -311,14 +311,8 @@ def wrap(signal_name, sender=dispatcher.Anonymous, *args, **kwargs):  # pylint:
     """Wraps the suite in before/after signals, ensuring
     that after signal is always sent."""
     safe = kwargs.pop('safe', False)
-    signal_name = signal_name.upper().replace('-', '_')
     send_func = safe_send if safe else send
-    try:
-        before_signal = globals()['BEFORE_' + signal_name]
-        success_signal = globals()['SUCCESSFUL_' + signal_name]
-        after_signal = globals()['AFTER_' + signal_name]
-    except KeyError:
-        raise ValueError('Invalid wrapped signal name: {}'.format(signal_name))
+    before_signal, success_signal, after_signal = _get_wrapped_signals(signal_name)
     try:
         send_func(before_signal, sender, *args, **kwargs)
         yield
@@ -330,6 +324,31 @@ def wrap(signal_name, sender=dispatcher.Anonymous, *args, **kwargs):  # pylint:
         send_func(after_signal, sender, *args, **kwargs)
 
 
+# Maps names passed to wrap() onto their (before, successful, after) signals.
+_wrapped_signals = {}
+
+
+def _get_wrapped_signals(signal_name):
+    """
+    Resolve the before/successful/after signals for the specified wrapped
+    signal name. wrap() is used several times for every job, and the signals
+    never change, so the result is cached.
+
+    """
+    signals = _wrapped_signals.get(signal_name)
+    if signals is not None:
+        return signals
+
+    name = signal_name.upper().replace('-', '_')
+    try:
+        signals = (globals()['BEFORE_' + name],
+                   globals()['SUCCESSFUL_' + name],
+                   globals()['AFTER_' + name])
+    except KeyError:
+        raise ValueError('Invalid wrapped signal name: {}'.format(name))
+    return _wrapped_signals.setdefault(signal_name, signals)
+
+
 def wrapped(signal_name, sender=dispatcher.Anonymous, safe=False):
     """A decorator for wrapping function in signal dispatch."""
     @wrapt.decorator
@@ -44,6 +44,9 @@ RESET_COLOR = colorama.Style.RESET_ALL
 
 DEFAULT_INIT_BUFFER_CAPACITY = 1000
 
+# Maximum number of (innermost) stack frames included in logged tracebacks.
+MAX_TRACEBACK_FRAMES = 30
+
 _indent_level = 0
 _indent_width = 4
 _console_handler = None
@@ -186,17 +189,23 @@ def log_error(e, logger, critical=False):
 
     if critical:
         log_func = logger.critical
+        log_level = logging.CRITICAL
     else:
         log_func = logger.error
+        log_level = logging.ERROR
 
     if isinstance(e, KeyboardInterrupt):
         old_level = set_indent_level(0)
         logger.info('Got CTRL-C. Aborting.')
         set_indent_level(old_level)
+    elif not logger.isEnabledFor(log_level):
+        # Nothing would be emitted, so don't bother formatting the traceback
+        # and error message.
+        pass
     elif isinstance(e, (WAError, DevlibError)):
         log_func(str(e))
     elif isinstance(e, subprocess.CalledProcessError):
-        tb = get_traceback()
+        tb = get_traceback(limit=-MAX_TRACEBACK_FRAMES)
         log_func(tb)
         command = e.cmd
         if e.args:
@@ -204,15 +213,22 @@ def log_error(e, logger, critical=False):
         message = 'Command \'{}\' returned non-zero exit status {}\nOUTPUT:\n{}\n'
         log_func(message.format(command, e.returncode, e.output))
     elif isinstance(e, SyntaxError):
-        tb = get_traceback()
+        tb = get_traceback(limit=-MAX_TRACEBACK_FRAMES)
         log_func(tb)
         message = 'Syntax Error in {}, line {}, offset {}:'
         log_func(message.format(e.filename, e.lineno, e.offset))
         log_func('\t{}'.format(e.msg))
     else:
-        tb = get_traceback()
+        tb = get_traceback(limit=-MAX_TRACEBACK_FRAMES)
         log_func(tb)
         log_func('{}({})'.format(e.__class__.__name__, e))
+        # Other process-related exceptions (e.g. subprocess.TimeoutExpired)
+        # also carry the output of the command that triggered them.
+        output = getattr(e, 'output', None)
+        if output:
+            if isinstance(output, bytes):
+                output = output.decode(errors='replace')
+            log_func('OUTPUT:\n{}\n'.format(output))
 
     e.logged = True
 
@@ -33,6 +33,7 @@ import subprocess
 import sys
 import traceback
 import uuid
+from collections import deque
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from functools import reduce  # pylint: disable=redefined-builtin
@@ -138,11 +139,14 @@ def get_null():
     return 'NUL' if os.name == 'nt' else '/dev/null'
 
 
-def get_traceback(exc=None):
+def get_traceback(exc=None, limit=None):
     """
     Returns the string with the traceback for the specifiec exc
     object, or for the current exception exc is not specified.
 
+    ``limit`` is passed on to ``traceback.print_tb()``; a negative value
+    limits the traceback to that many of the innermost frames.
+
     """
     if exc is None:
         exc = sys.exc_info()
@@ -150,7 +154,7 @@ def get_traceback(exc=None):
         return None
     tb = exc[2]
     sio = StringIO()
-    traceback.print_tb(tb, file=sio)
+    traceback.print_tb(tb, limit=limit, file=sio)
     del tb  # needs to be done explicitly see: http://docs.python.org/2/library/sys.html#sys.exc_info
     return sio.getvalue()
 
@@ -547,6 +551,28 @@ def merge_dicts_simple(base, other):
     return result
 
 
+def roundrobin(*iterables):
+    """
+    Yields items from each of the specified iterables in turn, dropping
+    iterables as they become exhausted, e.g. ::
+
+        roundrobin('ABC', 'D', 'EF') --> A D E B F C
+
+    Unlike ``zip_longest()``, this does not pad shorter iterables, so no
+    filler values are created when the iterables differ in length.
+
+    """
+    iterators = deque(iter(it) for it in iterables)
+    while iterators:
+        iterator = iterators.popleft()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            continue
+        iterators.append(iterator)
+        yield item
+
+
 def touch(path):
     with open(path, 'w'):
         pass